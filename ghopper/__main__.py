@@ -0,0 +1,48 @@
+"""Console entry point.
+
+The most frequent commands (view, list, remove) are parsed with argparse and
+run without importing Click at all; everything else, including the top-level
+help, is handed to the Click group in ghopper.cli.
+"""
+import sys
+
+FAST_COMMANDS = {"view", "list", "remove"}
+
+def _fast_parser():
+    import argparse
+
+    from ghopper.commands import COMMANDS
+
+    parser = argparse.ArgumentParser(prog="ghopper")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    view = subparsers.add_parser("view", description=COMMANDS["view"][1])
+    view.add_argument("alias", nargs="?")
+
+    subparsers.add_parser("list", description=COMMANDS["list"][1])
+
+    remove = subparsers.add_parser("remove", description=COMMANDS["remove"][1])
+    remove.add_argument("alias")
+
+    return parser
+
+def main(argv=None):
+    """Run ghopper, skipping Click for the commands it isn't needed for."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in FAST_COMMANDS:
+        from ghopper import handlers
+
+        args = _fast_parser().parse_args(argv)
+        if args.command == "view":
+            handlers.view_repo(args.alias)
+        elif args.command == "list":
+            handlers.list_repos()
+        elif args.command == "remove":
+            handlers.remove_repo(args.alias)
+        return
+
+    from ghopper.cli import cli
+    cli(args=argv, prog_name="ghopper")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""ghopper subcommands, one module per command."""
+
+# Name -> (import path, help text). The single source of each command's help,
+# shared by the Click commands, the lazy group in ghopper.cli and the argparse
+# fast path in ghopper.__main__; kept free of Click imports for the latter.
+COMMANDS = {
+    "view": ("ghopper.commands.view.view", "Open a repository or its GitHub page."),
+    "pr": ("ghopper.commands.pr.pr", "Open a GitHub PR compare view."),
+    "add": ("ghopper.commands.add.add", "Add a repository to config."),
+    "list": ("ghopper.commands.list_.list_", "List all configured repos."),
+    "remove": ("ghopper.commands.remove.remove", "Remove a repo from the config."),
+    "modify": ("ghopper.commands.modify.modify", "Modify the branches of an existing repo."),
+    "checkout": ("ghopper.commands.checkout.checkout",
+                 "Quickly checkout to a prod/pre/dev branch using alias."),
+    "commit": ("ghopper.commands.commit.commit",
+               "Commit to the current branch, then cherry-pick to the corresponding "
+               "dev and pre branches."),
+}
@@ -0,0 +1,36 @@
+import click
+from pathlib import Path
+
+from ghopper.commands import COMMANDS
+from ghopper.config import load_config, normalize_repo_url, save_config
+from ghopper.git import get_current_git_repo
+
+
+@click.command("add", help=COMMANDS["add"][1])
+@click.argument("alias", required=False)
+@click.option("--url", help="GitHub repository URL")
+@click.option("--prod", help="Production branch")
+@click.option("--pre", help="Pre-production branch")
+@click.option("--dev", help="Development branch")
+def add(alias, url, prod, pre, dev):
+    config = load_config()
+
+    if not url:
+        url = get_current_git_repo()
+    if not url:
+        click.echo("No URL provided and not in a Git repo.")
+        return
+
+    normalized_url = normalize_repo_url(url)
+
+    if not alias:
+        alias = Path(normalized_url).name.replace(".git", "")
+
+    branches = {k: v for k, v in {"prod": prod, "pre": pre, "dev": dev}.items() if v}
+    config["repos"][alias] = {
+        "url": f"https://{normalized_url}",
+        "branches": branches
+    }
+
+    save_config(config)
+    click.echo(f"✅ Added repo '{alias}' → https://{normalized_url}")
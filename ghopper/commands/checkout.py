@@ -0,0 +1,31 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.config import load_config, resolve_alias_from_context
+
+
+@click.command("checkout", help=COMMANDS["checkout"][1])
+@click.argument("branch_key", type=click.Choice(["prod", "pre", "dev"]))
+@click.argument("alias", required=False)
+def checkout(branch_key, alias):
+    config = load_config()
+    alias = resolve_alias_from_context(config, alias)
+    if not alias:
+        return
+
+    repo = config["repos"].get(alias)
+    if not repo:
+        click.echo(f"Alias '{alias}' not found.")
+        return
+
+    branch_name = repo["branches"].get(branch_key)
+    if not branch_name:
+        click.echo(f"No '{branch_key}' branch configured for alias '{alias}'")
+        return
+
+    import subprocess
+    try:
+        subprocess.run(["git", "checkout", branch_name], check=True)
+        click.echo(f"🚀 Switched to {branch_key} branch: {branch_name}")
+    except subprocess.CalledProcessError:
+        click.echo(f"❌ Failed to checkout branch '{branch_name}'")
@@ -0,0 +1,90 @@
+import click
+
+from ghopper.commands import COMMANDS
+
+
+@click.command("commit", help=COMMANDS["commit"][1])
+@click.option('-m', '--message', required=True, help="Commit message")
+def commit(message):
+    import subprocess
+
+    # Perform the git commit
+    try:
+        subprocess.check_call(["git", "commit", "-m", message])
+        click.echo(f"✅ Committed changes with message: '{message}'")
+    except subprocess.CalledProcessError:
+        click.echo("❌ Commit failed. Please check your changes and try again.")
+        return
+
+    # Get the latest commit hash and the current branch name (e.g., TICKET-12345)
+    # from a single git process
+    last_commit_hash, current_branch = subprocess.check_output(
+        ["git", "rev-parse", "HEAD", "--abbrev-ref", "HEAD"], text=True
+    ).split()
+    if current_branch == "HEAD":
+        click.echo(f"⚠️ Committed {last_commit_hash} on a detached HEAD; skipping cherry-pick.")
+        return
+
+    # Generate the target branches by appending -dev and -pre-merge to the current branch name
+    dev_branch = f"{current_branch}-dev"
+    pre_branch = f"{current_branch}-pre-merge"
+
+    # Cherry-pick to the dev and pre branches
+    target_branches = [dev_branch, pre_branch]
+
+    for target in target_branches:
+        try:
+            click.echo(f"Cherry-picking commit {last_commit_hash} into {target} branch...")
+
+            # Try to checkout the target branch
+            try:
+                subprocess.check_call(["git", "checkout", target])
+            except subprocess.CalledProcessError:
+                click.echo(f"❌ {target} branch does not exist. Aborting the operation.")
+                return  # Abort if the branch doesn't exist
+
+            # Only inspect the index when the cherry-pick fails; a clean pick
+            # can't leave conflicts, so the happy path spawns no extra git
+            if subprocess.call(["git", "cherry-pick", last_commit_hash]) != 0:
+                unmerged = subprocess.check_output(
+                    ["git", "diff", "--name-only", "--diff-filter=U"], text=True
+                ).splitlines()
+                if not unmerged:
+                    click.echo(f"❌ Failed to cherry-pick to {target}.")
+                    return
+
+                click.echo("⚠️ Conflict detected. Please resolve conflicts manually.")
+
+                # Wait for the user to input how to resolve the conflict
+                resolve_choice = click.prompt(
+                    "Do you want to resolve conflicts automatically using 'theirs' strategy? (y/n)",
+                    type=str
+                ).lower()
+
+                if resolve_choice == 'y':
+                    click.echo("🔧 Resolving conflicts automatically using 'theirs' strategy.")
+                    # Resolve only the conflicted paths using 'git checkout --theirs',
+                    # so unrelated untracked files never get staged
+                    subprocess.check_call(["git", "checkout", "--theirs", "--", *unmerged])
+                    subprocess.check_call(["git", "add", "--", *unmerged])
+
+                    # Continue the merge and push
+                    subprocess.check_call(["git", "commit", "--no-edit"])
+                    subprocess.check_call(["git", "push", "origin", target])
+
+                    click.echo(f"✅ Conflict resolved and changes pushed to {target}.")
+                    continue
+
+                else:
+                    click.echo("❌ Aborted. Please resolve conflicts manually and push changes.")
+                    return
+
+            subprocess.check_call(["git", "push", "origin", target])
+            click.echo(f"✅ Successfully cherry-picked to {target} and pushed.")
+        except subprocess.CalledProcessError:
+            click.echo(f"❌ Failed to cherry-pick to {target}.")
+            return
+
+    # Checkout back to the original feature branch
+    subprocess.check_call(["git", "checkout", current_branch])
+    click.echo(f"✅ Cherry-pick complete. Commit {last_commit_hash} added to {', '.join(target_branches)}.")
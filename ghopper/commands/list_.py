@@ -0,0 +1,9 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.handlers import list_repos
+
+
+@click.command("list", help=COMMANDS["list"][1])
+def list_():
+    list_repos()
@@ -0,0 +1,31 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.config import load_config, resolve_alias_from_context, save_config
+
+
+@click.command("modify", help=COMMANDS["modify"][1])
+@click.argument("alias", required=False)
+@click.option("--prod", help="New production branch")
+@click.option("--pre", help="New pre-production branch")
+@click.option("--dev", help="New development branch")
+def modify(alias, prod, pre, dev):
+    config = load_config()
+    alias = resolve_alias_from_context(config, alias)
+    if not alias:
+        return
+
+    repo = config["repos"].get(alias)
+    if not repo:
+        click.echo(f"Alias '{alias}' not found.")
+        return
+
+    if prod:
+        repo["branches"]["prod"] = prod
+    if pre:
+        repo["branches"]["pre"] = pre
+    if dev:
+        repo["branches"]["dev"] = dev
+
+    save_config(config)
+    click.echo(f"✅ Updated branches for '{alias}'")
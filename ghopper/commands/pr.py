@@ -0,0 +1,49 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.config import load_config, resolve_alias_from_context
+
+
+@click.command("pr", help=COMMANDS["pr"][1])
+@click.argument("args", nargs=-1)
+@click.option("--from", "from_branch", default=None, help="Branch to compare from")
+def pr(args, from_branch):
+    config = load_config()
+
+    if len(args) == 1:
+        alias = None
+        target = args[0]
+    elif len(args) == 2:
+        alias, target = args
+    else:
+        click.echo("Usage: pr [alias] <target>")
+        return
+
+    alias = resolve_alias_from_context(config, alias)
+    if not alias:
+        return
+
+    repo = config["repos"].get(alias)
+    if not repo:
+        click.echo(f"Alias '{alias}' not found.")
+        return
+
+    to_branch = repo["branches"].get(target)
+    if not to_branch:
+        click.echo(f"Branch key '{target}' not found in alias '{alias}'")
+        return
+
+    import subprocess
+    if not from_branch:
+        try:
+            from_branch = subprocess.check_output(
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"], text=True
+            ).strip()
+        except subprocess.CalledProcessError:
+            click.echo("Could not determine current branch.")
+            return
+
+    import webbrowser
+    url = f"{repo['url']}/compare/{to_branch}...{from_branch}"
+    webbrowser.open(url)
+    click.echo(f"🔀 PR Compare: {url}")
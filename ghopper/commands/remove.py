@@ -0,0 +1,10 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.handlers import remove_repo
+
+
+@click.command("remove", help=COMMANDS["remove"][1])
+@click.argument("alias")
+def remove(alias):
+    remove_repo(alias)
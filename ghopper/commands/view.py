@@ -0,0 +1,10 @@
+import click
+
+from ghopper.commands import COMMANDS
+from ghopper.handlers import view_repo
+
+
+@click.command("view", help=COMMANDS["view"][1])
+@click.argument("alias", required=False)
+def view(alias):
+    view_repo(alias)
@@ -0,0 +1,135 @@
+import functools
+import os
+import re
+from pathlib import Path
+
+# Use orjson when the "fast" extra is installed, stdlib json otherwise. Both
+# serialize to UTF-8 bytes so the file never depends on the locale encoding.
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(data):
+        return json.dumps(data, indent=4).encode("utf-8")
+
+
+_GIT_SSH_RE = re.compile(r"git@([\w.-]+):([\w./-]+)")
+
+
+@functools.lru_cache(maxsize=None)
+def _config_dir():
+    """Config directory: ~/.config/ghopper, expanded on first use."""
+    return Path(os.path.expanduser("~/.config/ghopper"))
+
+def _config_path():
+    """Config path: ~/.config/ghopper/config.json"""
+    return _config_dir() / "config.json"
+
+@functools.lru_cache(maxsize=4)
+def _load_cached(path, mtime_ns):
+    """Parse the config file; memoized per (path, mtime) within a process."""
+    return _loads(Path(path).read_bytes())
+
+def load_config():
+    """Load the configuration data from the JSON file."""
+    config_path = _config_path()
+    try:
+        return _load_cached(str(config_path), config_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error loading config: {e}")
+    return {"repos": {}}
+
+def save_config(data):
+    """Save configuration to the JSON file."""
+    config_path = _config_path()
+    # Underscore keys are in-memory indexes, not part of the stored format.
+    data = {k: v for k, v in data.items() if not k.startswith("_")}
+    try:
+        if not _config_dir().exists():
+            _config_dir().mkdir(parents=True, exist_ok=True)
+        # Write a sibling of the real file (following a symlinked config) and
+        # rename it over that, so a failed or interrupted save never leaves a
+        # truncated config behind.
+        target = config_path.resolve()
+        tmp_path = target.with_name(target.name + ".tmp")
+        try:
+            tmp_path.write_bytes(_dumps(data))
+            try:
+                os.chmod(tmp_path, target.stat().st_mode & 0o7777)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, target)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        print(f"✅ Config saved at {config_path}")
+    except Exception as e:
+        print(f"Error saving config: {e}")
+    finally:
+        _load_cached.cache_clear()
+
+@functools.lru_cache(maxsize=128)
+def normalize_repo_url(url):
+    """Normalize GitHub URLs to a comparable form."""
+    from urllib.parse import urlparse
+
+    url = url.strip()
+    if url.endswith(".git"):
+        url = url[:-4]
+
+    if url.startswith("git@"):
+        match = _GIT_SSH_RE.match(url)
+        if match:
+            host, path = match.groups()
+            base_host = host.split("-")[0]
+            return f"{base_host}/{path}".lower()
+
+    elif url.startswith("http"):
+        parsed = urlparse(url)
+        base_host = parsed.netloc.split(":")[0].split("-")[0]
+        return f"{base_host}{parsed.path}".strip("/").lower()
+
+    return url.lower()
+
+def _repo_index(config):
+    """Map normalized repo URLs to aliases, built once per loaded config.
+
+    Derived from each entry's "url" rather than stored, so hand edits to
+    config.json are always honoured.
+    """
+    index = config.get("_by_norm")
+    if index is None:
+        index = {}
+        for alias, info in config["repos"].items():
+            index.setdefault(normalize_repo_url(info["url"]), alias)
+        config["_by_norm"] = index
+    return index
+
+def find_alias_by_repo_url(config, repo_url):
+    """Find the alias for a given repo URL by normalized comparison."""
+    return _repo_index(config).get(normalize_repo_url(repo_url))
+
+def resolve_alias_from_context(config, alias=None):
+    """Resolve alias either from the argument or current Git repo context."""
+    if alias:
+        return alias
+    from ghopper.git import get_current_git_repo
+    repo_url = get_current_git_repo()
+    if not repo_url:
+        print("Not in a Git repo or can't detect remote.")
+        return None
+    alias = find_alias_by_repo_url(config, repo_url)
+    if not alias:
+        print("Repo not found in config.")
+        return None
+    return alias
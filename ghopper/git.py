@@ -0,0 +1,55 @@
+import configparser
+import functools
+import os
+import subprocess
+from pathlib import Path
+
+_NON_PLAIN_CHARS = set('"#;\\')
+
+
+def _read_origin_url():
+    """Read remote.origin.url from the nearest .git/config without running git.
+
+    Returns None whenever the answer isn't certain (GIT_DIR overrides,
+    worktrees and submodules whose .git is a file, unparsable config, no
+    origin entry) so the caller can ask git itself.
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+    cwd = Path.cwd()
+    for directory in (cwd, *cwd.parents):
+        git_dir = directory / ".git"
+        if git_dir.is_dir():
+            break
+        if git_dir.exists():
+            return None
+    else:
+        return None
+
+    parser = configparser.ConfigParser(strict=False, interpolation=None)
+    try:
+        parser.read(git_dir / "config", encoding="utf-8")
+    except (configparser.Error, ValueError):
+        return None
+    url = parser.get('remote "origin"', "url", fallback=None)
+    # configparser doesn't understand git's quoting, escapes or comments, and
+    # folds indented lines into the value; only trust a plain token.
+    if not url or any(c in url for c in _NON_PLAIN_CHARS) or any(c.isspace() for c in url):
+        return None
+    return url
+
+
+@functools.lru_cache(maxsize=1)
+def get_current_git_repo():
+    """Get current git repo remote URL."""
+    remote_url = _read_origin_url()
+    if remote_url:
+        return remote_url
+    try:
+        remote_url = subprocess.check_output(
+            ["git", "config", "--get", "remote.origin.url"],
+            text=True
+        ).strip()
+        return remote_url if remote_url else None
+    except subprocess.CalledProcessError:
+        return None
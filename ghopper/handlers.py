@@ -0,0 +1,41 @@
+"""Click-free bodies of the commands served by the argparse fast path."""
+from ghopper.config import load_config, resolve_alias_from_context, save_config
+
+
+def view_repo(alias=None):
+    """Body of `ghopper view`."""
+    config = load_config()
+    alias = resolve_alias_from_context(config, alias)
+    if not alias:
+        return
+
+    repo = config["repos"].get(alias)
+    if repo:
+        import webbrowser
+        webbrowser.open(repo["url"])
+        print(f"🌐 Opening {repo['url']}")
+    else:
+        print(f"Alias '{alias}' not found.")
+
+def list_repos():
+    """Body of `ghopper list`."""
+    config = load_config()
+    repos = config.get("repos", {})
+    if not repos:
+        print("No repos added yet.")
+        return
+
+    for alias, info in repos.items():
+        print(f"{alias} → {info['url']}")
+        for key, branch in info["branches"].items():
+            print(f"  [{key}] → {branch}")
+
+def remove_repo(alias):
+    """Body of `ghopper remove`."""
+    config = load_config()
+    if alias in config["repos"]:
+        del config["repos"][alias]
+        save_config(config)
+        print(f"❌ Removed '{alias}'")
+    else:
+        print(f"Alias '{alias}' not found.")
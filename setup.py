@@ -8,9 +8,12 @@ setup(
     install_requires=[
         "Click>=8.0.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.9"],
+    },
     entry_points={
         'console_scripts': [
-            'ghopper=ghopper.cli:cli',  # Ensure that 'cli' is correctly located in ghopper/cli.py
+            'ghopper=ghopper.__main__:main',
         ],
     },
     author="Suman Khadka",  # Replace with your actual name or handle